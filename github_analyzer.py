@@ -56,23 +56,30 @@ def get_repo_info(repo_url):
         console.print(f"[red]Error parsing URL: {str(e)}[/red]")
         raise
 
+def get_headers():
+    """
+    Build GitHub API request headers
+    """
+    # Get GitHub token from environment variables
+    github_token = os.getenv('GITHUB_TOKEN')
+    
+    # Create headers
+    headers = {
+        'Accept': 'application/vnd.github+json',
+        'X-GitHub-Api-Version': '2022-11-28'
+    }
+    
+    # Add authorization header if token is available
+    if github_token:
+        headers['Authorization'] = f'token {github_token}'
+    return headers
+
 def fetch_repo_data(owner, repo):
     """
     Fetch repository data from GitHub API
     """
     try:
-        # Get GitHub token from environment variables
-        github_token = os.getenv('GITHUB_TOKEN')
-        
-        # Create headers
-        headers = {
-            'Accept': 'application/vnd.github+json',
-            'X-GitHub-Api-Version': '2022-11-28'
-        }
-        
-        # Add authorization header if token is available
-        if github_token:
-            headers['Authorization'] = f'token {github_token}'
+        headers = get_headers()
         
         # Get repository information
         with Progress(console=console) as progress:
@@ -162,6 +169,29 @@ def get_commit_stats(commits):
     
     return stats
 
+def get_commit_count(owner, repo):
+    """
+    Get the total number of commits on the default branch, or None if it
+    cannot be fetched (e.g. rate limit exceeded)
+    """
+    # With one commit per page, the page number of the "last" link is the commit count
+    commits_url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/commits?per_page=1"
+    try:
+        response = requests.get(commits_url, headers=get_headers())
+        if response.status_code == 409:
+            # Empty repository
+            return 0
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        console.print(f"[yellow]Could not fetch commit count: {str(e)}[/yellow]")
+        return None
+    last_link = response.links.get('last', {}).get('url')
+    if last_link:
+        match = re.search(r'[?&]page=(\d+)', last_link)
+        if match:
+            return int(match.group(1))
+    return len(response.json())
+
 def display_repo_info(repo_data):
     """
     Display repository information in a formatted panel
@@ -247,12 +277,14 @@ def display_commit_stats(commit_stats):
 def analyze_repository(*args, **kwargs):
     pass
 
-def analyze_github_repo(owner, repo):
+def analyze_github_repo(owner, repo, count_commits=False):
     """
     Fetch and return repository metadata, contributors, and recent commits for web/GUI use.
+    The total commit count costs an extra API call, so it is only fetched when count_commits is set.
     """
     repo_data, contributors, commits = fetch_repo_data(owner, repo)
     commit_stats = get_commit_stats(commits)
+    total_commits = get_commit_count(owner, repo) if count_commits else None
     # Top 5 contributors
     top_contributors = [
         {
@@ -270,14 +302,18 @@ def analyze_github_repo(owner, repo):
     ] if commits else []
     return {
         'name': repo_data.get('name', 'N/A'),
+        'full_name': repo_data.get('full_name', f'{owner}/{repo}'),
         'description': repo_data.get('description', 'N/A'),
         'stars': repo_data.get('stargazers_count', 0),
         'forks': repo_data.get('forks_count', 0),
         'watchers': repo_data.get('watchers_count', 0),
+        # watchers_count mirrors stargazers_count; subscribers_count is the real watcher count
+        'subscribers': repo_data.get('subscribers_count', 0),
         'license': repo_data.get('license', {}).get('name', 'N/A'),
         'created_at': repo_data.get('created_at', 'N/A'),
         'updated_at': repo_data.get('updated_at', 'N/A'),
         'top_contributors': top_contributors,
+        'total_commits': total_commits,
         'commit_stats': commit_stats,
         'recent_commits': top_commits
     }
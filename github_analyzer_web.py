@@ -7,6 +7,7 @@ from PyPDF2 import PdfReader
 from docx import Document
 from github_analyzer import analyze_github_repo
 from github_insights import get_repo_insights
+from github_history import connect, record_snapshot
 
 st.set_page_config(page_title="GitHub Analyzer Web", layout="wide")
 st.title("GitHub Repository Analyzer (Web)")
@@ -45,10 +46,26 @@ def extract_github_links_from_excel(file):
             links.update(extract_github_links_from_text(val))
     return links
 
-def analyze_and_display(owner, repo):
+def open_history():
+    # One snapshot database connection per run, shared by every analyzed repo
     try:
-        meta = analyze_github_repo(owner, repo)
+        return connect()
+    except Exception as e:
+        st.warning(f"Snapshot history disabled: {e}")
+        return None
+
+def analyze_and_display(owner, repo, history_conn=None):
+    try:
+        meta = analyze_github_repo(owner, repo, count_commits=history_conn is not None)
         insights = get_repo_insights(owner, repo)
+        if history_conn is not None:
+            try:
+                # Key history on GitHub's canonical name so differently-cased or
+                # renamed URLs for the same repository share one history
+                canonical_owner, canonical_repo = meta['full_name'].split('/', 1)
+                record_snapshot(history_conn, canonical_owner, canonical_repo, meta)
+            except Exception as e:
+                st.warning(f"Could not save snapshot for {owner}/{repo}: {e}")
         st.subheader(f"{owner}/{repo}")
         st.json(meta)
         # Only show unique info from insights (e.g., languages)
@@ -69,7 +86,12 @@ if mode == MODE_SINGLE:
         match = re.match(r"https?://github\.com/([\w\-]+)/([\w\-.]+)", url)
         if match:
             owner, repo = match.groups()
-            meta, insights = analyze_and_display(owner, repo)
+            history_conn = open_history()
+            try:
+                meta, insights = analyze_and_display(owner, repo, history_conn)
+            finally:
+                if history_conn is not None:
+                    history_conn.close()
             if meta and insights:
                 output_text = f"{owner}/{repo}\nMeta: {meta}\nInsights: {insights}"
         else:
@@ -89,13 +111,24 @@ else:
             st.warning("No GitHub repository links found in the file.")
         else:
             st.info(f"Found {len(links)} unique GitHub repositories.")
-            for url in list(links)[:500]:
-                match = re.match(r"https?://github\.com/([\w\-]+)/([\w\-.]+)", url)
-                if match:
-                    owner, repo = match.groups()
-                    meta, insights = analyze_and_display(owner, repo)
-                    if meta and insights:
-                        output_text += f"{owner}/{repo}\nMeta: {meta}\nInsights: {insights}\n\n"
+            # Streamlit reruns this branch on every interaction while the file is
+            # uploaded, so only record snapshots the first time an upload is analyzed
+            recorded_uploads = st.session_state.setdefault("recorded_uploads", set())
+            history_conn = None
+            if uploaded_file.file_id not in recorded_uploads:
+                history_conn = open_history()
+            try:
+                for url in list(links)[:500]:
+                    match = re.match(r"https?://github\.com/([\w\-]+)/([\w\-.]+)", url)
+                    if match:
+                        owner, repo = match.groups()
+                        meta, insights = analyze_and_display(owner, repo, history_conn)
+                        if meta and insights:
+                            output_text += f"{owner}/{repo}\nMeta: {meta}\nInsights: {insights}\n\n"
+            finally:
+                if history_conn is not None:
+                    history_conn.close()
+                    recorded_uploads.add(uploaded_file.file_id)
 
 if output_text:
     st.download_button("Copy Output", output_text, file_name="github_analysis.txt")
@@ -0,0 +1,214 @@
+import os
+import sqlite3
+from datetime import datetime, timezone
+
+# Default location of the snapshot database (override with GITHUB_HISTORY_DB)
+DEFAULT_DB_PATH = "github_history.db"
+
+# Numeric columns that can be queried for trends
+METRICS = ("stars", "forks", "watchers", "commits")
+
+# Metrics that may be missing from a snapshot (stored as NULL and skipped in trends)
+NULLABLE_METRICS = ("commits",)
+
+SECONDS_PER_DAY = 86400
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    owner TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    taken_at INTEGER NOT NULL,
+    stars INTEGER NOT NULL DEFAULT 0,
+    forks INTEGER NOT NULL DEFAULT 0,
+    watchers INTEGER NOT NULL DEFAULT 0,
+    commits INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_snapshots_repo_time
+    ON snapshots (owner, repo, taken_at);
+CREATE INDEX IF NOT EXISTS idx_snapshots_time
+    ON snapshots (taken_at);
+"""
+
+def connect(db_path=None):
+    """
+    Open (and create if needed) the snapshot database
+    """
+    db_path = db_path or os.getenv("GITHUB_HISTORY_DB", DEFAULT_DB_PATH)
+    conn = sqlite3.connect(db_path)
+    # WAL lets readers run trend queries while the analyzer keeps appending
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+def _to_epoch(value):
+    """
+    Convert a datetime (naive values are treated as UTC) or epoch number to epoch seconds
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp())
+    return int(value)
+
+def _from_epoch(value):
+    """
+    Convert stored epoch seconds back to a UTC datetime
+    """
+    return datetime.fromtimestamp(value, tz=timezone.utc)
+
+def _check_metric(metric):
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric '{metric}'. Choose one of: {', '.join(METRICS)}")
+
+def _snapshot_row(owner, repo, meta, taken_at):
+    return (
+        owner,
+        repo,
+        _to_epoch(taken_at or datetime.now(timezone.utc)),
+        meta.get("stars", 0) or 0,
+        meta.get("forks", 0) or 0,
+        # GitHub's watchers_count is a copy of the star count; subscribers are the watchers
+        meta.get("subscribers", 0) or 0,
+        meta.get("total_commits"),
+    )
+
+def record_snapshot(conn, owner, repo, meta, taken_at=None):
+    """
+    Append one analysis result (as returned by analyze_github_repo) to the store
+    """
+    with conn:
+        conn.execute(
+            "INSERT INTO snapshots (owner, repo, taken_at, stars, forks, watchers, commits) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            _snapshot_row(owner, repo, meta, taken_at)
+        )
+
+def record_snapshots(conn, snapshots):
+    """
+    Append many (owner, repo, meta, taken_at) tuples in a single transaction
+    """
+    with conn:
+        conn.executemany(
+            "INSERT INTO snapshots (owner, repo, taken_at, stars, forks, watchers, commits) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (_snapshot_row(owner, repo, meta, taken_at) for owner, repo, meta, taken_at in snapshots)
+        )
+
+def get_history(conn, owner, repo, since=None, until=None):
+    """
+    Yield the snapshots of one repository in time order
+    """
+    query = (
+        "SELECT taken_at, stars, forks, watchers, commits FROM snapshots "
+        "WHERE owner = ? AND repo = ? AND taken_at >= ? AND taken_at <= ? "
+        "ORDER BY taken_at, id"
+    )
+    params = (owner, repo, _to_epoch(since) or 0, _to_epoch(until) or 2**63 - 1)
+    for taken_at, stars, forks, watchers, commits in conn.execute(query, params):
+        yield {
+            'taken_at': _from_epoch(taken_at),
+            'stars': stars,
+            'forks': forks,
+            'watchers': watchers,
+            'commits': commits
+        }
+
+def growth_rates(conn, metric="stars", since=None, until=None, owner=None, repo=None):
+    """
+    Yield the change of a metric per repository between its first and last
+    snapshot in the given time range, including the average change per day.
+
+    Aggregation happens inside SQLite, so only one row per repository is
+    ever held in memory.
+    """
+    _check_metric(metric)
+    filters = ["taken_at >= ?", "taken_at <= ?"]
+    params = [_to_epoch(since) or 0, _to_epoch(until) or 2**63 - 1]
+    if owner:
+        filters.append("owner = ?")
+        params.append(owner)
+    if repo:
+        filters.append("repo = ?")
+        params.append(repo)
+    # Only nullable metrics need the extra check, which costs a table lookup per row
+    value_filter = f" AND s.{metric} IS NOT NULL" if metric in NULLABLE_METRICS else ""
+    if value_filter:
+        filters.append(f"{metric} IS NOT NULL")
+    # One grouped scan of the (owner, repo, taken_at) index finds each
+    # repository's boundaries; the boundary values are then single index
+    # lookups (id breaks same-second ties). INDEXED BY keeps the planner from
+    # picking the time index, which would need a temp sort for the GROUP BY.
+    query = f"""
+        SELECT g.owner, g.repo, g.first_at,
+            (SELECT s.{metric} FROM snapshots s
+             WHERE s.owner = g.owner AND s.repo = g.repo AND s.taken_at = g.first_at{value_filter}
+             ORDER BY s.id LIMIT 1),
+            g.last_at,
+            (SELECT s.{metric} FROM snapshots s
+             WHERE s.owner = g.owner AND s.repo = g.repo AND s.taken_at = g.last_at{value_filter}
+             ORDER BY s.id DESC LIMIT 1),
+            g.samples
+        FROM (
+            SELECT owner, repo, MIN(taken_at) AS first_at, MAX(taken_at) AS last_at,
+                COUNT(*) AS samples
+            FROM snapshots INDEXED BY idx_snapshots_repo_time
+            WHERE {' AND '.join(filters)}
+            GROUP BY owner, repo
+        ) AS g
+        ORDER BY g.owner, g.repo
+    """
+    for row_owner, row_repo, first_at, first_value, last_at, last_value, samples in conn.execute(query, params):
+        delta = last_value - first_value
+        days = (last_at - first_at) / SECONDS_PER_DAY
+        yield {
+            'owner': row_owner,
+            'repo': row_repo,
+            'metric': metric,
+            'start': _from_epoch(first_at),
+            'end': _from_epoch(last_at),
+            'start_value': first_value,
+            'end_value': last_value,
+            'change': delta,
+            'percent_change': round(delta / first_value * 100, 2) if first_value else None,
+            'per_day': round(delta / days, 4) if days else None,
+            'samples': samples
+        }
+
+def moving_average(conn, owner, repo, metric="stars", window_days=7, since=None, until=None):
+    """
+    Yield each snapshot of a repository with the moving average of a metric
+    over the snapshots taken in the preceding `window_days` days. The window
+    is time-based because snapshots are taken irregularly (computed inside SQLite)
+    """
+    _check_metric(metric)
+    if window_days <= 0:
+        raise ValueError("Moving average window must be a positive number of days")
+    # The window covers (taken_at - window_days, taken_at], hence the "- 1"
+    window_seconds = int(window_days * SECONDS_PER_DAY) - 1
+    since = _to_epoch(since) or 0
+    # The window is computed over rows from one window before `since`, so the
+    # first points in range still average over a full window
+    query = f"""
+        SELECT taken_at, value, average FROM (
+            SELECT id, taken_at, {metric} AS value,
+                AVG({metric}) OVER (ORDER BY taken_at RANGE BETWEEN ? PRECEDING AND CURRENT ROW) AS average
+            FROM snapshots
+            WHERE owner = ? AND repo = ? AND taken_at >= ? AND taken_at <= ?
+                AND {metric} IS NOT NULL
+        )
+        WHERE taken_at >= ?
+        ORDER BY taken_at, id
+    """
+    params = (
+        window_seconds, owner, repo, max(since - window_seconds, 0),
+        _to_epoch(until) or 2**63 - 1, since
+    )
+    for taken_at, value, average in conn.execute(query, params):
+        yield {
+            'taken_at': _from_epoch(taken_at),
+            metric: value,
+            'moving_average': round(average, 2)
+        }
@@ -0,0 +1,73 @@
+import pytest
+
+from github_history import connect, growth_rates, moving_average, record_snapshot, record_snapshots
+
+DAY = 86400
+
+@pytest.fixture
+def conn():
+    conn = connect(":memory:")
+    yield conn
+    conn.close()
+
+def test_growth_rates_breaks_same_second_ties_by_insertion_order(conn):
+    record_snapshot(conn, "a", "r", {"stars": 10}, taken_at=DAY)
+    record_snapshot(conn, "a", "r", {"stars": 5}, taken_at=DAY)
+    record_snapshot(conn, "a", "r", {"stars": 20}, taken_at=3 * DAY)
+    record_snapshot(conn, "a", "r", {"stars": 40}, taken_at=3 * DAY)
+
+    [row] = growth_rates(conn, "stars")
+
+    assert row["start_value"] == 10
+    assert row["end_value"] == 40
+    assert row["change"] == 30
+    assert row["per_day"] == 15
+    assert row["samples"] == 4
+
+def test_growth_rates_filters(conn):
+    record_snapshots(conn, [
+        (owner, repo, {"stars": day * 10}, day * DAY)
+        for owner, repo in [("a", "r"), ("a", "s"), ("b", "r")]
+        for day in range(1, 11)
+    ])
+
+    assert [(row["owner"], row["repo"]) for row in growth_rates(conn)] == [("a", "r"), ("a", "s"), ("b", "r")]
+    assert [(row["owner"], row["repo"]) for row in growth_rates(conn, owner="a")] == [("a", "r"), ("a", "s")]
+    assert [(row["owner"], row["repo"]) for row in growth_rates(conn, repo="r")] == [("a", "r"), ("b", "r")]
+
+    [row] = growth_rates(conn, owner="b", repo="r", since=6 * DAY, until=8 * DAY)
+    assert (row["start_value"], row["end_value"], row["samples"]) == (60, 80, 3)
+
+def test_growth_rates_skips_missing_commit_counts(conn):
+    record_snapshot(conn, "a", "r", {"total_commits": None}, taken_at=DAY)
+    record_snapshot(conn, "a", "r", {"total_commits": 100}, taken_at=2 * DAY)
+    record_snapshot(conn, "a", "r", {"total_commits": 130}, taken_at=5 * DAY)
+    record_snapshot(conn, "a", "r", {"total_commits": None}, taken_at=5 * DAY)
+
+    [row] = growth_rates(conn, "commits")
+
+    assert (row["start_value"], row["end_value"], row["samples"]) == (100, 130, 2)
+    assert row["per_day"] == 10
+
+def test_growth_rates_rejects_unknown_metric(conn):
+    with pytest.raises(ValueError):
+        list(growth_rates(conn, "issues"))
+
+def test_moving_average_uses_time_window_on_irregular_snapshots(conn):
+    record_snapshots(conn, [
+        ("a", "r", {"stars": stars}, taken_at)
+        for stars, taken_at in [(10, DAY), (20, DAY + 60), (30, 2 * DAY), (40, 30 * DAY), (50, 31 * DAY)]
+    ])
+
+    averages = [point["moving_average"] for point in moving_average(conn, "a", "r", window_days=2)]
+
+    # The 28-day gap empties the window instead of averaging across it
+    assert averages == [10, 15, 20, 40, 45]
+
+def test_moving_average_since_keeps_full_window(conn):
+    record_snapshots(conn, [("a", "r", {"stars": day}, day * DAY) for day in range(1, 121)])
+
+    points = list(moving_average(conn, "a", "r", window_days=3, since=100 * DAY, until=102 * DAY))
+
+    assert [point["stars"] for point in points] == [100, 101, 102]
+    assert [point["moving_average"] for point in points] == [99, 100, 101]